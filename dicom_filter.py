@@ -14,6 +14,7 @@ import pydicom as dicom
 import numpy as np
 import operator
 import cv2
+import csv
 import json
 import re
 import os
@@ -62,6 +63,8 @@ parser.add_argument('-p', '--phiMode', default="skip", type=str,
                     help='PHI handling modes: detect, allow, or skip')
 parser.add_argument('-s', '--similarityThreshold', default=0.95,
                     help='A similarity threshold represents the minimum similarity between two texts')
+parser.add_argument('-n', '--dryRun', default=False, action='store_true',
+                    help='Only read DICOM headers and write a CSV match manifest instead of output files')
 
 
 class TagCondition:
@@ -229,8 +232,6 @@ def read_input_dicom(input_file_path, filter_expression, text_file, inspect_tags
     2) Check if the DICOM headers match the specified filters
     3) Return the DICOM dataset if it matches, else None
     """
-    conditions = parse_filter_string(filter_expression)
-
     # Read DICOM
     try:
         print(f"Reading input file: {input_file_path.name}")
@@ -244,9 +245,32 @@ def read_input_dicom(input_file_path, filter_expression, text_file, inspect_tags
         print(f"Unable to read dicom file: {ex}")
         return None
 
+    _, _, match = evaluate_dataset(ds, filter_expression, text_file, inspect_tags, phi_mode)
+
+    return ds if match else None
+
+def evaluate_dataset(ds, filter_expression, text_file, inspect_tags, phi_mode, findings=None, report_all=False):
+    """
+    Evaluate a DICOM dataset against the filters and the PHI handling mode.
+
+    Filters stop at the first failing condition unless `report_all` is set,
+    in which case every condition is checked on its own and its verdict
+    reported.
+
+    Returns:
+        Tuple of ([(condition, verdict), ...], phi_found, match)
+        where the verdicts are empty unless `report_all` is set and
+        phi_found is None if PHI detection did not run.
+    """
     # Apply filters with verbose output
+    conditions = parse_filter_string(filter_expression)
     print(f"\nApplying filter: {filter_expression}")
-    match = passes_filters(ds, conditions)
+    if report_all:
+        verdicts = [(cond, passes_filters(ds, [cond])) for cond in conditions]
+        match = all(verdict for _, verdict in verdicts)
+    else:
+        verdicts = []
+        match = passes_filters(ds, conditions)
     print(f"Result: {'MATCH' if match else 'NO MATCH'}\n")
 
     # -------------------------------------------------------------------------
@@ -258,30 +282,43 @@ def read_input_dicom(input_file_path, filter_expression, text_file, inspect_tags
         - "skip"   → skip PHI detection
         - "allow"  → allow PHI even if detected
     """
+    phi_found = None
     if text_file and phi_mode != "skip":
         text = text_file.read_text(encoding="utf-8").split()
-        phi_found = detect_phi(text, ds, inspect_tags)
-        match phi_mode:
-            case "detect":
-                if phi_found:
-                    print("  -> PHI detected, skipping dataset")
-                    return None
-            case "allow":
-                if phi_found:
-                    print("  -> PHI detected, but allowed (passing dataset)")
-                    return ds if match else None
-                return None
+        phi_found = detect_phi(text, ds, inspect_tags, findings=findings)
+        match = apply_phi_mode(match, phi_found, phi_mode)
 
-    return ds if match else None
+    return verdicts, phi_found, match
+
+def apply_phi_mode(match, phi_found, phi_mode):
+    """
+    Returns the final verdict of a filter `match` given the PHI
+    detection result and the PHI handling mode.
+    """
+    match phi_mode:
+        case "detect":
+            if phi_found:
+                print("  -> PHI detected, skipping dataset")
+                return False
+        case "allow":
+            if phi_found:
+                print("  -> PHI detected, but allowed (passing dataset)")
+                return match
+            return False
+
+    return match
 
 def similarity(a, b):
     """Returns a similarity ratio between 0 and 1."""
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
-def detect_phi(text, ds, tags, threshold=0.90):
+def detect_phi(text, ds, tags, threshold=0.90, findings=None):
     """
     Detects possible PHI in `text` by comparing it against the extracted
     DICOM text & dates, using exact, substring, and similarity matching.
+
+    If a `findings` list is given, each match is appended to it as a
+    (word, dicom_tag) tuple.
     """
     all_text_and_dates = extract_text_and_dates(ds, tags)
 
@@ -297,6 +334,8 @@ def detect_phi(text, ds, tags, threshold=0.90):
             if word.lower() in (w.lower() for w in dicom_words):
                 print(f"\n[PHI - EXACT MATCH] Found: '{word}' | DICOM Tag: {dicom_tag} | Value: '{dicom_val}'")
                 flagged = True
+                if findings is not None:
+                    findings.append((word, dicom_tag))
                 continue
 
             # --- Similarity (fuzzy) match ---
@@ -306,6 +345,8 @@ def detect_phi(text, ds, tags, threshold=0.90):
                     print(
                         f"\n[PHI - SIMILARITY {score:.2f}] Found: '{word}' ≈ '{w}' | DICOM Tag: {dicom_tag} | Value: '{dicom_val}'")
                     flagged = True
+                    if findings is not None:
+                        findings.append((word, dicom_tag))
                     break  # stop checking other words in this DICOM field
 
     return flagged
@@ -459,6 +500,95 @@ def save_dicom(dicom_file, output_path):
     dicom_file.save_as(str(output_path))
 
 
+MANIFEST_NAME = "dry_run_manifest.csv"
+
+MANIFEST_KEY_TAGS = [
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "SOPInstanceUID",
+    "Modality",
+    "SeriesDescription",
+]
+
+PIXEL_DATA_KEYWORDS = ["PixelData", "FloatPixelData", "DoubleFloatPixelData"]
+
+
+def inspect_input_dicom(input_file_path, filter_expression, text_file, inspect_tags, phi_mode):
+    """
+    Dry-run counterpart of `read_input_dicom`: reads only the DICOM header
+    and returns a manifest row with key tags, per-condition verdicts, PHI
+    findings and the final match verdict. Pixel data is never decoded.
+    """
+    row = {
+        "path": str(input_file_path),
+        "size_bytes": input_file_path.stat().st_size,
+    }
+
+    # Values larger than defer_size (e.g. PixelData) are not read until accessed
+    try:
+        print(f"Reading input file header: {input_file_path.name}")
+        ds = dicom.dcmread(str(input_file_path), defer_size="1 KB")
+    except Exception as ex:
+        print(f"Unable to read dicom file: {ex}")
+        row["error"] = str(ex)
+        row["match"] = False
+        return row
+
+    for keyword in MANIFEST_KEY_TAGS:
+        row[keyword] = str(ds.get(keyword, ""))
+    row["has_pixel_data"] = 'PixelData' in ds
+    if not row["has_pixel_data"]:
+        print("No pixel data in this DICOM.")
+
+    # Iterating the dataset during PHI detection loads deferred values, so drop
+    # the pixel elements first (their binary values are never inspected anyway)
+    for keyword in PIXEL_DATA_KEYWORDS:
+        if keyword in ds:
+            delattr(ds, keyword)
+
+    findings = []
+    verdicts, phi_found, match = evaluate_dataset(
+        ds, filter_expression, text_file, inspect_tags, phi_mode, findings=findings, report_all=True
+    )
+    for cond, verdict in verdicts:
+        row[manifest_condition_column(cond)] = verdict
+    if phi_found is not None:
+        row["phi_found"] = phi_found
+    row["phi_findings"] = ";".join(f"{word}@{tag}" for word, tag in findings)
+    # A real run skips files without pixel data before filtering
+    row["match"] = row["has_pixel_data"] and match
+    return row
+
+
+def manifest_condition_column(cond):
+    """
+    Returns the manifest column name for a filter condition, e.g. 'Modality=CT/MR'
+    """
+    expected_str = "/".join(cond.values) if cond.op == "=" else cond.values[0]
+    return f"{cond.tag}{cond.op}{expected_str}"
+
+
+def save_manifest(rows, filter_expression, output_path):
+    """
+    Save dry-run manifest rows as a CSV file
+    """
+    columns = ["path", *MANIFEST_KEY_TAGS, "has_pixel_data"]
+    columns += [manifest_condition_column(c) for c in parse_filter_string(filter_expression)]
+    columns += ["phi_found", "phi_findings", "match", "size_bytes", "error"]
+
+    print(f"Saving dry-run manifest: {output_path.name}")
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    matched = [r for r in rows if r["match"]]
+    print(
+        f"{len(matched)} of {len(rows)} files match "
+        f"({sum(r['size_bytes'] for r in matched)} bytes of matching input)"
+    )
+
+
 def zipper_mapper(mapper1, mapper2, fill_value=None):
     """
     Yields:
@@ -580,6 +710,14 @@ def main(options: Namespace, inputdir: Path, outputdir: Path):
 
     mapper = check_setup_and_map(inputdir, outputdir, options)
 
+    if options.dryRun:
+        rows = [
+            inspect_input_dicom(input_file, options.dicomFilter, input_txt_file, options.inspectTags, options.phiMode)
+            for input_file, input_txt_file, _ in mapper
+        ]
+        save_manifest(rows, options.dicomFilter, outputdir / MANIFEST_NAME)
+        return
+
     for input_file, input_txt_file, output_file in mapper:
         # Read each input file from the input directory that matches the input filter specified
         dcm_img = read_input_dicom(input_file, options.dicomFilter, input_txt_file, options.inspectTags, options.phiMode)
@@ -0,0 +1,145 @@
+import csv
+import shutil
+from pathlib import Path
+
+import pydicom
+import pydicom.filereader
+import pytest
+from pydicom.data import get_testdata_file
+from pydicom.tag import Tag
+
+import dicom_filter
+from dicom_filter import (
+    parser, main, parse_filter_string, apply_phi_mode, read_input_dicom, inspect_input_dicom,
+    manifest_condition_column, save_manifest, MANIFEST_NAME, MANIFEST_KEY_TAGS
+)
+
+CT_SMALL = Path(get_testdata_file("CT_small.dcm"))
+
+
+@pytest.fixture
+def ct_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'CT_small.dcm'
+    shutil.copy(CT_SMALL, path)
+    return path
+
+
+def test_manifest_condition_column():
+    columns = [manifest_condition_column(c) for c in parse_filter_string('Modality=CT/MR,SliceThickness>1')]
+    assert columns == ['Modality=CT/MR', 'SliceThickness>1']
+
+
+def test_inspect_reports_every_condition(ct_file: Path):
+    row = inspect_input_dicom(ct_file, 'Modality=MR,SliceThickness>1,Modality!=US', None, None, 'skip')
+
+    assert row['Modality=MR'] is False
+    assert row['SliceThickness>1'] is True
+    assert row['Modality!=US'] is True
+    assert row['has_pixel_data'] is True
+    assert row['match'] is False
+    assert row['Modality'] == 'CT'
+    assert row['size_bytes'] == ct_file.stat().st_size
+
+
+def test_inspect_does_not_read_pixel_data(ct_file: Path, tmp_path: Path, monkeypatch):
+    calls = []
+    real_read = pydicom.filereader.read_deferred_data_element
+
+    def spy(filename, mode, timestamp, raw_data_elem, **kwargs):
+        calls.append(raw_data_elem.tag)
+        return real_read(filename, mode, timestamp, raw_data_elem, **kwargs)
+
+    monkeypatch.setattr(pydicom.filereader, 'read_deferred_data_element', spy)
+    text_file = tmp_path / 'CT_small.txt'
+    text_file.write_text('CompressedSamples')
+
+    row = inspect_input_dicom(ct_file, 'Modality=CT/MR,SliceThickness>1', text_file, None, 'detect')
+
+    assert Tag('PixelData') not in calls
+    assert row['has_pixel_data'] is True
+    assert row['phi_found'] is True
+    assert 'CompressedSamples@PatientName' in row['phi_findings']
+    assert row['match'] is False
+
+
+@pytest.fixture
+def no_pixel_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'no_pixels.dcm'
+    ds = pydicom.dcmread(CT_SMALL)
+    del ds.PixelData
+    ds.save_as(path)
+    return path
+
+
+def test_read_skips_phi_detection_without_pixel_data(no_pixel_file: Path, tmp_path: Path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(dicom_filter, 'detect_phi', lambda *args, **kwargs: calls.append(args))
+    text_file = tmp_path / 'no_pixels.txt'
+    text_file.write_text('CompressedSamples')
+
+    assert read_input_dicom(no_pixel_file, 'Modality=CT', text_file, None, 'detect') is None
+    assert calls == []
+
+
+def test_inspect_without_pixel_data_does_not_match(no_pixel_file: Path):
+    row = inspect_input_dicom(no_pixel_file, 'Modality=CT', None, None, 'skip')
+
+    assert row['has_pixel_data'] is False
+    assert row['Modality=CT'] is True
+    assert row['match'] is False
+
+
+@pytest.mark.parametrize('match, phi_found, phi_mode, expected', [
+    (True, True, 'detect', False),
+    (True, False, 'detect', True),
+    (False, False, 'detect', False),
+    (True, True, 'allow', True),
+    (False, True, 'allow', False),
+    (True, False, 'allow', False),
+    (True, True, 'skip', True),
+    (False, True, 'skip', False),
+])
+def test_apply_phi_mode(match, phi_found, phi_mode, expected):
+    assert apply_phi_mode(match, phi_found, phi_mode) is expected
+
+
+def test_save_manifest(ct_file: Path, tmp_path: Path):
+    broken_file = tmp_path / 'broken.dcm'
+    broken_file.write_bytes(b'not a dicom file')
+    filter_expression = 'Modality=CT/MR,SliceThickness>1'
+    rows = [
+        inspect_input_dicom(ct_file, filter_expression, None, None, 'skip'),
+        inspect_input_dicom(broken_file, filter_expression, None, None, 'skip'),
+    ]
+
+    output_path = tmp_path / MANIFEST_NAME
+    save_manifest(rows, filter_expression, output_path)
+
+    with open(output_path, newline='') as f:
+        reader = csv.DictReader(f)
+        written = list(reader)
+
+    assert reader.fieldnames == [
+        'path', *MANIFEST_KEY_TAGS, 'has_pixel_data', 'Modality=CT/MR', 'SliceThickness>1',
+        'phi_found', 'phi_findings', 'match', 'size_bytes', 'error'
+    ]
+    assert written[0]['path'] == str(ct_file)
+    assert written[0]['Modality=CT/MR'] == 'True'
+    assert written[0]['match'] == 'True'
+    assert written[0]['error'] == ''
+    assert written[1]['path'] == str(broken_file)
+    assert written[1]['match'] == 'False'
+    assert written[1]['error'] != ''
+
+
+def test_dry_run_writes_only_manifest(tmp_path: Path):
+    inputdir = tmp_path / 'incoming'
+    outputdir = tmp_path / 'outgoing'
+    inputdir.mkdir()
+    outputdir.mkdir()
+    shutil.copy(CT_SMALL, inputdir / 'CT_small.dcm')
+
+    options = parser.parse_args(['--dryRun', '--dicomFilter', 'Modality=CT'])
+    main(options, inputdir, outputdir)
+
+    assert [p.name for p in outputdir.rglob('*') if p.is_file()] == [MANIFEST_NAME]